@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Dict, Iterable, List, Tuple
 
 from .models import Event, Match
@@ -27,38 +27,54 @@ class TeamPerformance:
 
 
 def compute_standings(event: Event, matches: Iterable[Match] | None = None) -> List[TeamPerformance]:
-    matches = list(matches) if matches is not None else event.matches
-    performances: Dict[str, TeamPerformance] = {
-        team_id: TeamPerformance(team_id=team_id) for team_id in event.teams.keys()
-    }
-
-    for match in matches:
-        if match.result is None:
-            continue
-        perf_one = performances[match.team_one_id]
-        perf_two = performances[match.team_two_id]
-        perf_one.matches_played += 1
-        perf_two.matches_played += 1
-        perf_one.maps_won += match.result.team_one_score
-        perf_one.maps_lost += match.result.team_two_score
-        perf_two.maps_won += match.result.team_two_score
-        perf_two.maps_lost += match.result.team_one_score
-
-        if match.result.team_one_score == match.result.team_two_score:
-            perf_one.ties += 1
-            perf_two.ties += 1
-        elif match.result.winner_id == match.team_one_id:
-            perf_one.wins += 1
-            perf_two.losses += 1
-        else:
-            perf_two.wins += 1
-            perf_one.losses += 1
-
-    return sorted(
-        performances.values(),
-        key=lambda perf: (perf.wins, perf.map_difference, perf.maps_won),
-        reverse=True,
-    )
+    return StandingsTracker(event, matches).standings()
+
+
+class StandingsTracker:
+    """Standings kept up to date as individual match results are added or withdrawn."""
+
+    def __init__(self, event: Event, matches: Iterable[Match] | None = None):
+        self._performances: Dict[str, TeamPerformance] = {
+            team_id: TeamPerformance(team_id=team_id) for team_id in event.teams.keys()
+        }
+        for match in matches if matches is not None else event.matches:
+            self.add(match)
+
+    def add(self, match: Match) -> None:
+        _apply_result(self._performances, match, 1)
+
+    def remove(self, match: Match) -> None:
+        _apply_result(self._performances, match, -1)
+
+    def standings(self) -> List[TeamPerformance]:
+        return sorted(
+            (replace(perf) for perf in self._performances.values()),
+            key=lambda perf: (perf.wins, perf.map_difference, perf.maps_won),
+            reverse=True,
+        )
+
+
+def _apply_result(performances: Dict[str, TeamPerformance], match: Match, sign: int) -> None:
+    if match.result is None:
+        return
+    perf_one = performances[match.team_one_id]
+    perf_two = performances[match.team_two_id]
+    perf_one.matches_played += sign
+    perf_two.matches_played += sign
+    perf_one.maps_won += sign * match.result.team_one_score
+    perf_one.maps_lost += sign * match.result.team_two_score
+    perf_two.maps_won += sign * match.result.team_two_score
+    perf_two.maps_lost += sign * match.result.team_one_score
+
+    if match.result.team_one_score == match.result.team_two_score:
+        perf_one.ties += sign
+        perf_two.ties += sign
+    elif match.result.winner_id == match.team_one_id:
+        perf_one.wins += sign
+        perf_two.losses += sign
+    else:
+        perf_two.wins += sign
+        perf_one.losses += sign
 
 
 def expected_score(event: Event, team_one_id: str, team_two_id: str) -> Tuple[float, float]:
@@ -86,10 +102,11 @@ def suggest_highlight_matches(event: Event, threshold: float = 0.1) -> List[Matc
 
 def strength_of_schedule(event: Event) -> Dict[str, float]:
     """Average opponent rating for each team based on scheduled matches."""
+    ratings = {team_id: team.average_rating for team_id, team in event.teams.items()}
     sos: Dict[str, List[float]] = {team_id: [] for team_id in event.teams.keys()}
     for match in event.matches:
-        sos[match.team_one_id].append(event.teams[match.team_two_id].average_rating)
-        sos[match.team_two_id].append(event.teams[match.team_one_id].average_rating)
+        sos[match.team_one_id].append(ratings[match.team_two_id])
+        sos[match.team_two_id].append(ratings[match.team_one_id])
     return {
         team_id: (sum(values) / len(values)) if values else 0.0
         for team_id, values in sos.items()
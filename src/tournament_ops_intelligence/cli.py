@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import argparse
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List
 
-from .reports import format_event_overview
-from .repository import TournamentRepository
-from .scheduler import ScheduleRequest, build_round_robin
-from .simulator import simulate_matches
+from .formats import REPORT_FORMATS
+
+# Subcommands import their modules on demand so each invocation only pays for
+# what it uses.
+
+if TYPE_CHECKING:
+    from .repository import TournamentRepository
+    from .watch import WatchedEvent
 
 
 def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
@@ -29,14 +34,43 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
     schedule_parser.add_argument("--best-of", type=int, default=3, help="Best-of value for matches")
     schedule_parser.add_argument("--venues", nargs="*", help="Optional list of venue ids to rotate through")
     schedule_parser.add_argument("--output", type=Path, help="Where to write updated event JSON")
+    schedule_parser.add_argument("--compact", action="store_true", help="Write JSON without indentation")
+    schedule_parser.add_argument(
+        "--parallel-venues",
+        action="store_true",
+        help="Pack matches into concurrent venue slots (matches-per-day becomes blocks per day)",
+    )
+    schedule_parser.add_argument("--rest-minutes", type=int, default=0, help="Minimum rest between a team's matches")
+    schedule_parser.add_argument("--double-round-robin", action="store_true", help="Play every pairing twice")
 
     simulate_parser = subparsers.add_parser("simulate", help="Simulate match results")
     simulate_parser.add_argument("input", type=Path, help="Path to event JSON")
     simulate_parser.add_argument("--seed", type=int, help="Random seed for deterministic results")
     simulate_parser.add_argument("--output", type=Path, help="Where to write updated event JSON")
+    simulate_parser.add_argument("--compact", action="store_true", help="Write JSON without indentation")
 
     report_parser = subparsers.add_parser("report", help="Print event report summary")
     report_parser.add_argument("input", type=Path, help="Path to event JSON")
+    report_parser.add_argument("--format", choices=REPORT_FORMATS, default="text", help="Output format")
+    report_parser.add_argument(
+        "--full-schedule", action="store_true", help="Stream every scheduled match instead of the summary"
+    )
+
+    watch_parser = subparsers.add_parser("watch", help="Re-print reports whenever event files change")
+    watch_parser.add_argument("inputs", type=Path, nargs="+", help="Event JSON files to monitor")
+    watch_parser.add_argument("--interval", type=float, default=0.5, help="Polling interval in seconds")
+    watch_parser.add_argument("--format", choices=REPORT_FORMATS, default="text", help="Output format")
+
+    project_parser = subparsers.add_parser("project", help="Project final standings from live series states")
+    project_parser.add_argument("input", type=Path, help="Path to event JSON")
+
+    draw_parser = subparsers.add_parser("draw", help="Draw rating-balanced groups")
+    draw_parser.add_argument("input", type=Path, help="Path to event JSON")
+    draw_parser.add_argument("--groups", type=int, required=True, help="Number of groups")
+    draw_parser.add_argument("--seeds", type=int, default=4, help="Independent annealing runs")
+    draw_parser.add_argument("--iterations", type=int, default=20000, help="Annealing steps per run")
+    draw_parser.add_argument("--workers", type=int, help="Worker processes (defaults to one per seed)")
+    draw_parser.add_argument("--ignore-regions", action="store_true", help="Skip region separation")
 
     return parser.parse_args(argv)
 
@@ -47,7 +81,14 @@ def main(argv: List[str] | None = None) -> int:
         raise SystemExit("No command selected. Use --help for options.")
 
     if args.command == "schedule":
+        from .repository import TournamentRepository
+
         repo = TournamentRepository.from_json(args.input)
+        if args.parallel_venues:
+            return _schedule_parallel(repo, args)
+
+        from .scheduler import ScheduleRequest, build_round_robin
+
         request = ScheduleRequest(
             stage=args.stage,
             start_time=_parse_datetime(args.start),
@@ -59,29 +100,122 @@ def main(argv: List[str] | None = None) -> int:
         matches = build_round_robin(repo.event, request)
         repo.upsert_matches(matches)
         if args.output:
-            repo.save_json(args.output)
+            repo.save_json(args.output, compact=args.compact)
         else:
             print(f"Generated {len(matches)} matches.")
         return 0
 
     if args.command == "simulate":
+        from .repository import TournamentRepository
+        from .simulator import simulate_matches
+
         repo = TournamentRepository.from_json(args.input)
         matches = simulate_matches(repo.event, seed=args.seed)
         repo.upsert_matches(matches)
         if args.output:
-            repo.save_json(args.output)
+            repo.save_json(args.output, compact=args.compact)
         else:
             print("Simulation completed. Run the report command to view updated standings.")
         return 0
 
     if args.command == "report":
+        from .reports import ReportRenderer
+        from .repository import TournamentRepository
+
         repo = TournamentRepository.from_json(args.input)
-        print(format_event_overview(repo.event))
+        renderer = ReportRenderer(repo)
+        chunks = renderer.iter_full_schedule(args.format) if args.full_schedule else renderer.iter_render(args.format)
+        for chunk in chunks:
+            sys.stdout.write(chunk)
+        if args.format in ("text", "json"):
+            sys.stdout.write("\n")
+        return 0
+
+    if args.command == "watch":
+        from .watch import watch_events
+
+        show_path = len(args.inputs) > 1
+
+        def emit(item: WatchedEvent) -> None:
+            if show_path:
+                sys.stdout.write(f"==> {item.path} <==\n")
+            for chunk in item.iter_render(args.format):
+                sys.stdout.write(chunk)
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+
+        try:
+            watch_events(args.inputs, emit, interval=args.interval)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    if args.command == "project":
+        from .projection import StandingsProjection
+        from .repository import TournamentRepository
+
+        repo = TournamentRepository.from_json(args.input)
+        print("  Team                          W   Proj W")
+        for team_id, wins, expected in StandingsProjection(repo.event).projected_standings():
+            print(f"  {repo.event.teams[team_id].name:<28} {wins:>2.0f}   {expected:6.2f}")
+        return 0
+
+    if args.command == "draw":
+        from .draw import DrawRequest, draw_groups
+        from .repository import TournamentRepository
+
+        repo = TournamentRepository.from_json(args.input)
+        try:
+            draw = draw_groups(
+                repo.event,
+                DrawRequest(
+                    group_count=args.groups,
+                    separate_regions=not args.ignore_regions,
+                    seeds=range(args.seeds),
+                    iterations=args.iterations,
+                    workers=args.workers,
+                ),
+            )
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
+        for index, (group, mean) in enumerate(zip(draw.groups, draw.quality.group_means)):
+            print(f"Group {chr(ord('A') + index) if index < 26 else index + 1} (avg {mean:.1f}): {', '.join(group)}")
+        print(
+            f"Rating spread {draw.quality.rating_spread:.1f} | "
+            f"region conflicts {draw.quality.region_conflicts} | seed {draw.seed}"
+        )
         return 0
 
     raise SystemExit(f"Unknown command: {args.command}")
 
 
+def _schedule_parallel(repo: TournamentRepository, args: argparse.Namespace) -> int:
+    from .slot_scheduler import SlotScheduleRequest, StageSpec, build_slot_schedule
+
+    request = SlotScheduleRequest(
+        stages=[StageSpec(stage=args.stage, double_round_robin=args.double_round_robin, best_of=args.best_of)],
+        start_time=_parse_datetime(args.start),
+        match_duration_minutes=args.match_duration,
+        blocks_per_day=args.matches_per_day,
+        rest_minutes=args.rest_minutes,
+        venue_ids=args.venues,
+    )
+    try:
+        result = build_slot_schedule(repo.event, request)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+    repo.upsert_matches(result.matches)
+    if args.output:
+        repo.save_json(args.output, compact=args.compact)
+    else:
+        metrics = result.metrics
+        print(
+            f"Generated {metrics.matches} matches over {metrics.days} day(s); "
+            f"venue utilisation {metrics.utilisation * 100:.1f}%."
+        )
+    return 0
+
+
 def _parse_datetime(value: str) -> datetime:
     try:
         return datetime.fromisoformat(value)
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from .models import Event
+
+
+@dataclass(slots=True)
+class DrawRequest:
+    group_count: int
+    team_ids: Sequence[str] | None = None
+    pots: Sequence[Sequence[str]] | None = None
+    ratings: Mapping[str, float] | None = None
+    separate_regions: bool = True
+    seeds: Sequence[int] = (0, 1, 2, 3)
+    iterations: int = 20000
+    workers: int | None = None
+
+
+@dataclass(slots=True)
+class DrawQuality:
+    rating_variance: float
+    rating_spread: float
+    region_conflicts: int
+    group_means: List[float] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class GroupDraw:
+    groups: List[List[str]]
+    quality: DrawQuality
+    seed: int
+
+
+def draw_groups(event: Event, request: DrawRequest) -> GroupDraw:
+    """
+    Partition teams into balanced groups using simulated annealing.
+
+    Teams are swapped only within their pot, so every pot stays spread evenly
+    across groups. The objective is the variance of group mean ratings, with a
+    heavy penalty for placing more teams of one region in a group than the
+    region's size requires. Each seed anneals independently, in parallel
+    processes when more than one worker is available, and the best draw wins.
+    """
+    team_ids = list(request.team_ids) if request.team_ids is not None else sorted(event.teams.keys())
+    if request.group_count < 1 or request.group_count > len(team_ids):
+        raise ValueError(f"Cannot draw {len(team_ids)} teams into {request.group_count} groups")
+    for team_id in team_ids:
+        if team_id not in event.teams:
+            raise ValueError(f"Unknown team id: {team_id}")
+
+    ratings = {
+        team_id: float(request.ratings[team_id])
+        if request.ratings and team_id in request.ratings
+        else event.teams[team_id].average_rating
+        for team_id in team_ids
+    }
+    regions = {
+        team_id: event.teams[team_id].region if request.separate_regions else None for team_id in team_ids
+    }
+    pots = _resolve_pots(team_ids, request.pots, ratings)
+    problem = (team_ids, [ratings[t] for t in team_ids], [regions[t] for t in team_ids], pots, request.group_count)
+
+    seeds = list(request.seeds) or [0]
+    jobs = [(problem, seed, request.iterations) for seed in seeds]
+    workers = request.workers if request.workers is not None else len(seeds)
+    if workers <= 1 or len(jobs) == 1:
+        outcomes = [_anneal(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            outcomes = list(pool.map(_anneal, jobs))
+
+    best_cost, best_seed, assignment = min(outcomes, key=lambda outcome: (outcome[0], outcome[1]))
+    groups: List[List[str]] = [[] for _ in range(request.group_count)]
+    for index, group in enumerate(assignment):
+        groups[group].append(team_ids[index])
+    for group in groups:
+        group.sort(key=lambda team_id: (-ratings[team_id], team_id))
+    return GroupDraw(groups=groups, quality=evaluate_draw(event, groups, request.ratings), seed=best_seed)
+
+
+def evaluate_draw(
+    event: Event, groups: Sequence[Sequence[str]], ratings: Mapping[str, float] | None = None
+) -> DrawQuality:
+    """Quality metrics for any grouping, drawn or hand-made."""
+
+    def rating(team_id: str) -> float:
+        if ratings and team_id in ratings:
+            return float(ratings[team_id])
+        return event.teams[team_id].average_rating
+
+    means = [sum(rating(t) for t in group) / len(group) if group else 0.0 for group in groups]
+    centre = sum(means) / len(means) if means else 0.0
+    region_totals: Dict[str, int] = {}
+    for group in groups:
+        for team_id in group:
+            region = event.teams[team_id].region
+            if region is not None:
+                region_totals[region] = region_totals.get(region, 0) + 1
+    conflicts = 0
+    for group in groups:
+        counts: Dict[str, int] = {}
+        for team_id in group:
+            region = event.teams[team_id].region
+            if region is not None:
+                counts[region] = counts.get(region, 0) + 1
+        conflicts += sum(
+            max(0, count - math.ceil(region_totals[region] / len(groups))) for region, count in counts.items()
+        )
+    return DrawQuality(
+        rating_variance=sum((mean - centre) ** 2 for mean in means) / len(means) if means else 0.0,
+        rating_spread=(max(means) - min(means)) if means else 0.0,
+        region_conflicts=conflicts,
+        group_means=means,
+    )
+
+
+def _resolve_pots(
+    team_ids: Sequence[str], pots: Sequence[Sequence[str]] | None, ratings: Mapping[str, float]
+) -> List[List[int]]:
+    """Pots as lists of team indices; unpotted teams form a final pot ordered by rating."""
+    position = {team_id: index for index, team_id in enumerate(team_ids)}
+    resolved: List[List[int]] = []
+    seen: set[str] = set()
+    for pot in pots or []:
+        members = [team_id for team_id in pot if team_id in position and team_id not in seen]
+        seen.update(members)
+        if members:
+            resolved.append([position[t] for t in sorted(members, key=lambda t: (-ratings[t], t))])
+    remaining = [t for t in team_ids if t not in seen]
+    if remaining:
+        resolved.append([position[t] for t in sorted(remaining, key=lambda t: (-ratings[t], t))])
+    return resolved
+
+
+def _anneal(job: Tuple[tuple, int, int]) -> Tuple[float, int, List[int]]:
+    (team_ids, ratings, regions, pots, group_count), seed, iterations = job
+    rng = random.Random(seed)
+    team_count = len(team_ids)
+
+    # Snake seeding through the pots gives balanced group sizes and an even pot spread.
+    assignment = [0] * team_count
+    slot = 0
+    for pot in pots:
+        for index in pot:
+            lap, offset = divmod(slot, group_count)
+            assignment[index] = offset if lap % 2 == 0 else group_count - 1 - offset
+            slot += 1
+    for pot in pots:
+        groups_in_pot = [assignment[index] for index in pot]
+        rng.shuffle(groups_in_pot)
+        for index, group in zip(pot, groups_in_pot):
+            assignment[index] = group
+
+    sizes = [0] * group_count
+    sums = [0.0] * group_count
+    region_counts: List[Dict[str, int]] = [{} for _ in range(group_count)]
+    region_totals: Dict[str, int] = {}
+    for index, group in enumerate(assignment):
+        sizes[group] += 1
+        sums[group] += ratings[index]
+        region = regions[index]
+        if region is not None:
+            region_counts[group][region] = region_counts[group].get(region, 0) + 1
+            region_totals[region] = region_totals.get(region, 0) + 1
+    caps = {region: math.ceil(total / group_count) for region, total in region_totals.items()}
+    centre = sum(ratings) / team_count
+    spread = (max(ratings) - min(ratings)) or 1.0
+    penalty = spread * spread
+
+    def group_cost(group: int, total: float) -> float:
+        return (total / sizes[group] - centre) ** 2 if sizes[group] else 0.0
+
+    def excess(group: int, region: str | None, change: int) -> int:
+        if region is None:
+            return 0
+        count = region_counts[group].get(region, 0) + change
+        return max(0, count - caps[region])
+
+    def cost() -> float:
+        rating_cost = sum(group_cost(group, sums[group]) for group in range(group_count))
+        conflicts = sum(
+            max(0, count - caps[region]) for counts in region_counts for region, count in counts.items()
+        )
+        return rating_cost + penalty * conflicts
+
+    swappable = [pot for pot in pots if len(pot) > 1]
+    current = cost()
+    best = current
+    best_assignment = list(assignment)
+    if not swappable or group_count == 1:
+        return best, seed, best_assignment
+
+    def propose() -> Tuple[int, int, float]:
+        pot = rng.choice(swappable)
+        a, b = rng.sample(pot, 2)
+        ga, gb = assignment[a], assignment[b]
+        if ga == gb:
+            return a, b, 0.0
+        diff = ratings[b] - ratings[a]
+        delta = (
+            group_cost(ga, sums[ga] + diff) - group_cost(ga, sums[ga])
+            + group_cost(gb, sums[gb] - diff) - group_cost(gb, sums[gb])
+        )
+        ra, rb = regions[a], regions[b]
+        if ra != rb:
+            conflict_delta = (
+                excess(ga, ra, -1) - excess(ga, ra, 0)
+                + excess(ga, rb, 1) - excess(ga, rb, 0)
+                + excess(gb, rb, -1) - excess(gb, rb, 0)
+                + excess(gb, ra, 1) - excess(gb, ra, 0)
+            )
+            delta += penalty * conflict_delta
+        return a, b, delta
+
+    samples = [abs(propose()[2]) for _ in range(min(200, iterations))]
+    temperature = (sum(samples) / len(samples)) if samples and any(samples) else 1.0
+    cooling = (1e-4) ** (1.0 / max(1, iterations))
+
+    for _ in range(iterations):
+        a, b, delta = propose()
+        ga, gb = assignment[a], assignment[b]
+        if ga != gb and (delta <= 0 or rng.random() < math.exp(-delta / temperature)):
+            diff = ratings[b] - ratings[a]
+            sums[ga] += diff
+            sums[gb] -= diff
+            for region, group, change in ((regions[a], ga, -1), (regions[b], ga, 1), (regions[b], gb, -1), (regions[a], gb, 1)):
+                if region is not None:
+                    region_counts[group][region] = region_counts[group].get(region, 0) + change
+            assignment[a], assignment[b] = gb, ga
+            current += delta
+            if current < best - 1e-9:
+                best = current
+                best_assignment = list(assignment)
+        temperature *= cooling
+
+    return best, seed, best_assignment
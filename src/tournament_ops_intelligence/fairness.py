@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Mapping
+
+from .models import Event, Match
+from .timeutils import TimeIndex
+
+_DAY = 86400
+
+
+@dataclass(slots=True)
+class TeamFairness:
+    team_id: str
+    matches: int = 0
+    opponent_rating_sum: float = 0.0
+    back_to_backs: int = 0
+    rest_days: Dict[int, int] = field(default_factory=dict)
+    min_gap_hours: float | None = None
+    venue_switches: int = 0
+    home_matches: int = 0
+    away_matches: int = 0
+
+    @property
+    def strength_of_schedule(self) -> float:
+        return self.opponent_rating_sum / self.matches if self.matches else 0.0
+
+    @property
+    def home_imbalance(self) -> int:
+        """Matches in the team's home region minus matches in the opponent's."""
+        return self.home_matches - self.away_matches
+
+
+@dataclass(slots=True)
+class FairnessSummary:
+    strength_of_schedule_spread: float
+    max_back_to_backs: int
+    total_back_to_backs: int
+    min_gap_hours: float | None
+    total_venue_switches: int
+    max_home_imbalance: int
+
+
+def schedule_fairness(
+    event: Event,
+    matches: Iterable[Match] | None = None,
+    back_to_back_hours: float = 24.0,
+    ratings: Mapping[str, float] | None = None,
+) -> Dict[str, TeamFairness]:
+    """
+    Per-team fairness and travel-load metrics from a single pass over the matches in time order.
+
+    Consecutive matches starting less than ``back_to_back_hours`` apart count as a
+    back-to-back; ``rest_days`` maps whole days between consecutive starts to counts.
+    A match is at home when the venue's ``region`` metadata matches the team's region
+    and away when it matches the opponent's.
+    """
+    matches = list(matches) if matches is not None else event.matches
+    if ratings is None:
+        ratings = {team_id: team.average_rating for team_id, team in event.teams.items()}
+    regions = {team_id: team.region for team_id, team in event.teams.items()}
+    venue_regions = {venue_id: venue.metadata.get("region") for venue_id, venue in event.venues.items()}
+    back_to_back = back_to_back_hours * 3600
+
+    table = {team_id: TeamFairness(team_id=team_id) for team_id in event.teams.keys()}
+    last_start: Dict[str, int] = {}
+    last_venue: Dict[str, str | None] = {}
+    index = TimeIndex(matches, event.venues)
+    for start, match in zip(index.epochs, index.matches):
+        venue_region = venue_regions.get(match.venue_id) if match.venue_id is not None else None
+        for team_id, opponent_id in ((match.team_one_id, match.team_two_id), (match.team_two_id, match.team_one_id)):
+            row = table[team_id]
+            row.matches += 1
+            row.opponent_rating_sum += ratings[opponent_id]
+            previous = last_start.get(team_id)
+            if previous is not None:
+                gap = start - previous
+                if gap < back_to_back:
+                    row.back_to_backs += 1
+                days = gap // _DAY
+                row.rest_days[days] = row.rest_days.get(days, 0) + 1
+                hours = gap / 3600
+                if row.min_gap_hours is None or hours < row.min_gap_hours:
+                    row.min_gap_hours = hours
+                if last_venue[team_id] != match.venue_id:
+                    row.venue_switches += 1
+            last_start[team_id] = start
+            last_venue[team_id] = match.venue_id
+            if venue_region is not None:
+                if venue_region == regions[team_id]:
+                    row.home_matches += 1
+                elif venue_region == regions[opponent_id]:
+                    row.away_matches += 1
+    return table
+
+
+def summarise_fairness(table: Mapping[str, TeamFairness]) -> FairnessSummary:
+    played = [row for row in table.values() if row.matches]
+    sos = [row.strength_of_schedule for row in played]
+    gaps = [row.min_gap_hours for row in played if row.min_gap_hours is not None]
+    return FairnessSummary(
+        strength_of_schedule_spread=(max(sos) - min(sos)) if sos else 0.0,
+        max_back_to_backs=max((row.back_to_backs for row in played), default=0),
+        total_back_to_backs=sum(row.back_to_backs for row in played),
+        min_gap_hours=min(gaps) if gaps else None,
+        total_venue_switches=sum(row.venue_switches for row in played),
+        max_home_imbalance=max((abs(row.home_imbalance) for row in played), default=0),
+    )
+
+
+def compare_schedules(
+    event: Event,
+    schedules: Mapping[str, Iterable[Match]],
+    back_to_back_hours: float = 24.0,
+) -> Dict[str, FairnessSummary]:
+    """Summaries for alternative schedules side by side, e.g. several ``build_round_robin`` runs."""
+    ratings = {team_id: team.average_rating for team_id, team in event.teams.items()}
+    return {
+        name: summarise_fairness(schedule_fairness(event, matches, back_to_back_hours, ratings))
+        for name, matches in schedules.items()
+    }
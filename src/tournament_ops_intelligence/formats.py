@@ -0,0 +1,3 @@
+"""Report output formats, kept import-light so the CLI can use them without loading reports."""
+
+REPORT_FORMATS = ("text", "json", "csv", "html")
@@ -61,6 +61,23 @@ class MatchResult:
         return self.team_one_score == self.team_two_score
 
 
+@dataclass(slots=True)
+class SeriesState:
+    """Maps won so far in a series that is still being played."""
+
+    team_one_maps: int = 0
+    team_two_maps: int = 0
+
+
+def validate_series_score(best_of: int, team_one_maps: int, team_two_maps: int) -> None:
+    """Raise ``ValueError`` unless the map score can occur in a ``best_of`` series."""
+    required = best_of // 2 + 1
+    if not (0 <= team_one_maps <= required and 0 <= team_two_maps <= required):
+        raise ValueError(f"Map score {team_one_maps}-{team_two_maps} is out of range for a best-of-{best_of} series")
+    if team_one_maps == required and team_two_maps == required:
+        raise ValueError(f"Map score {team_one_maps}-{team_two_maps} has two winners in a best-of-{best_of} series")
+
+
 @dataclass(slots=True)
 class Match:
     """Scheduled or completed match between two teams."""
@@ -74,6 +91,7 @@ class Match:
     best_of: int = 1
     venue_id: str | None = None
     result: MatchResult | None = None
+    series_state: SeriesState | None = None
 
     def involves_team(self, team_id: str) -> bool:
         return team_id in {self.team_one_id, self.team_two_id}
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from math import comb
+from typing import Dict, List, Tuple
+
+from .analytics import expected_score
+from .models import Event, Match, validate_series_score
+
+DEFAULT_RESOLUTION = 1000
+
+
+def series_win_probability(best_of: int, map_probability: float, team_one_maps: int = 0, team_two_maps: int = 0) -> float:
+    """
+    Exact probability that team one takes the series from the given map score.
+
+    As in the simulator, a series is first to ``best_of // 2 + 1`` maps. With team
+    one needing ``a`` more maps and team two ``b``, team one wins when it takes
+    its ``a``-th map before dropping ``b``: the negative binomial sum
+    ``sum_{k<b} C(a-1+k, k) p^a (1-p)^k``.
+    """
+    validate_series_score(best_of, team_one_maps, team_two_maps)
+    required = best_of // 2 + 1
+    need_one = required - team_one_maps
+    need_two = required - team_two_maps
+    if need_one <= 0:
+        return 1.0
+    if need_two <= 0:
+        return 0.0
+    p = map_probability
+    q = 1.0 - p
+    return sum(comb(need_one - 1 + k, k) * p**need_one * q**k for k in range(need_two))
+
+
+@lru_cache(maxsize=None)
+def series_table(best_of: int, resolution: int = DEFAULT_RESOLUTION) -> Tuple[Tuple[Tuple[float, ...], ...], ...]:
+    """
+    Series win probabilities indexed ``[team_one_maps][team_two_maps][round(p * resolution)]``.
+
+    Built once per (best_of, resolution) so live updates are a constant-time lookup.
+    """
+    required = best_of // 2 + 1
+    steps = [index / resolution for index in range(resolution + 1)]
+    return tuple(
+        tuple(
+            tuple(series_win_probability(best_of, p, one, two) for p in steps)
+            for two in range(required)
+        )
+        for one in range(required)
+    )
+
+
+def lookup_series_probability(
+    best_of: int,
+    map_probability: float,
+    team_one_maps: int = 0,
+    team_two_maps: int = 0,
+    resolution: int = DEFAULT_RESOLUTION,
+) -> float:
+    """Table-backed ``series_win_probability`` with the map probability rounded to ``1 / resolution``."""
+    validate_series_score(best_of, team_one_maps, team_two_maps)
+    required = best_of // 2 + 1
+    if team_one_maps >= required:
+        return 1.0
+    if team_two_maps >= required:
+        return 0.0
+    return series_table(best_of, resolution)[team_one_maps][team_two_maps][round(map_probability * resolution)]
+
+
+class StandingsProjection:
+    """
+    Projected final wins for every team, kept current as live series scores change.
+
+    Completed matches count as played wins. Each unfinished match contributes its
+    series win probability to both teams' expected wins, so updating one series
+    adjusts two totals without revisiting the rest of the event.
+    """
+
+    def __init__(self, event: Event, resolution: int = DEFAULT_RESOLUTION):
+        self._resolution = resolution
+        self._wins: Dict[str, float] = {team_id: 0.0 for team_id in event.teams.keys()}
+        self._expected: Dict[str, float] = dict(self._wins)
+        self._matches: Dict[str, Match] = {}
+        self._map_probability: Dict[str, float] = {}
+        self._series_probability: Dict[str, float] = {}
+        for match in event.matches:
+            if match.result is not None:
+                if not match.result.is_tie:
+                    self._wins[match.result.winner_id] += 1
+                    self._expected[match.result.winner_id] += 1
+                continue
+            self._matches[match.id] = match
+            self._map_probability[match.id] = expected_score(event, match.team_one_id, match.team_two_id)[0]
+            state = match.series_state
+            probability = self._lookup(match, state.team_one_maps if state else 0, state.team_two_maps if state else 0)
+            self._series_probability[match.id] = probability
+            self._expected[match.team_one_id] += probability
+            self._expected[match.team_two_id] += 1.0 - probability
+
+    def series_probability(self, match_id: str) -> float:
+        """Current probability that team one wins the series."""
+        return self._series_probability[match_id]
+
+    def update(self, match_id: str, team_one_maps: int, team_two_maps: int) -> float:
+        """Apply a new live map score and return team one's updated series probability."""
+        match = self._matches[match_id]
+        probability = self._lookup(match, team_one_maps, team_two_maps)
+        delta = probability - self._series_probability[match_id]
+        self._series_probability[match_id] = probability
+        self._expected[match.team_one_id] += delta
+        self._expected[match.team_two_id] -= delta
+        return probability
+
+    def expected_wins(self) -> Dict[str, float]:
+        return dict(self._expected)
+
+    def projected_standings(self) -> List[Tuple[str, float, float]]:
+        """(team_id, wins so far, expected final wins), best projection first."""
+        return sorted(
+            ((team_id, self._wins[team_id], expected) for team_id, expected in self._expected.items()),
+            key=lambda row: (row[2], row[1]),
+            reverse=True,
+        )
+
+    def _lookup(self, match: Match, team_one_maps: int, team_two_maps: int) -> float:
+        return lookup_series_probability(
+            match.best_of, self._map_probability[match.id], team_one_maps, team_two_maps, self._resolution
+        )
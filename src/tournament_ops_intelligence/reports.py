@@ -1,62 +1,311 @@
 from __future__ import annotations
 
+import csv
+import html
+import io
+import json
 from datetime import datetime
-from typing import Iterable, List
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
 
-from .analytics import TeamPerformance, compute_standings, suggest_highlight_matches
+from .analytics import StandingsTracker, TeamPerformance, compute_standings, suggest_highlight_matches
+from .formats import REPORT_FORMATS
 from .models import Event, Match
+from .repository import TournamentRepository
+from .timeutils import TimeIndex, now_epoch, to_epoch
+
+REPORT_SECTIONS = ("teams", "schedule", "standings", "highlights")
+
+_SECTION_INPUTS: Dict[str, Tuple[str, ...]] = {
+    "teams": ("teams",),
+    "schedule": ("teams", "matches"),
+    "standings": ("teams", "matches", "results"),
+    "highlights": ("teams", "matches"),
+}
+_SECTION_TITLES = {
+    "teams": "Teams",
+    "schedule": "Upcoming Schedule",
+    "standings": "Standings",
+    "highlights": "Predicted Close Matchups",
+}
+_COLUMNS = {
+    "teams": ["team_id", "name", "avg_rating"],
+    "schedule": ["match_id", "scheduled_time", "team_one", "team_two", "stage", "round", "venue_id"],
+    "standings": ["team_id", "name", "wins", "losses", "ties", "map_difference", "win_rate"],
+    "highlights": ["match_id", "date", "team_one", "team_two", "stage"],
+}
 
 
 def format_event_overview(event: Event, matches: Iterable[Match] | None = None) -> str:
-    matches = list(matches) if matches is not None else event.matches
-    standings = compute_standings(event, matches)
-    highlights = suggest_highlight_matches(event)
-
-    report_lines: List[str] = []
-    report_lines.append(f"Event: {event.name} ({event.start_date} to {event.end_date})")
-    report_lines.append(f"Teams ({len(event.teams)} total):")
-    for team in sorted(event.teams.values(), key=lambda t: t.name):
-        report_lines.append(f"  - {team.name} [{team.id}] | Avg Rating: {team.average_rating:.1f}")
-
-    report_lines.append("")
-    report_lines.append("Upcoming Schedule:")
-    future_matches = [m for m in matches if m.scheduled_time >= datetime.utcnow()]
-    for match in future_matches[:10]:
-        report_lines.append(
-            f"  {match.scheduled_time.isoformat()} | {event.teams[match.team_one_id].name} vs {event.teams[match.team_two_id].name} "
-            f"(Stage: {match.stage}, Round: {match.round_number})"
-        )
-    if not future_matches:
-        report_lines.append("  No remaining scheduled matches.")
-
-    report_lines.append("")
-    report_lines.append("Standings:")
-    if any(perf.matches_played for perf in standings):
-        report_lines.extend(_format_standings_table(event, standings))
-    else:
-        report_lines.append("  No completed matches yet.")
-
-    if highlights:
-        report_lines.append("")
-        report_lines.append("Predicted Close Matchups:")
-        for match in highlights[:5]:
-            report_lines.append(
-                f"  {event.teams[match.team_one_id].name} vs {event.teams[match.team_two_id].name} "
-                f"on {match.scheduled_time.date()} (Stage {match.stage})"
+    return ReportRenderer(TournamentRepository(event), matches=matches).render("text")
+
+
+class ReportRenderer:
+    """
+    Renders event reports section by section.
+
+    Each section caches its rows and its rendered output keyed on the repository
+    version counters it depends on, so repeated renders only rebuild sections whose
+    inputs changed. Call ``TournamentRepository.mark_changed`` after mutating event
+    data in place. When a ``StandingsTracker`` is supplied it is read instead of
+    recomputing standings from every match.
+
+    ``matches`` restricts the schedule and standings to a subset of the event's
+    matches; predicted close matchups are still drawn from the whole event.
+    """
+
+    def __init__(
+        self,
+        repo: TournamentRepository,
+        upcoming_limit: int = 10,
+        highlight_limit: int = 5,
+        highlight_threshold: float = 0.1,
+        standings: StandingsTracker | None = None,
+        matches: Iterable[Match] | None = None,
+    ):
+        self._repo = repo
+        self._index: TimeIndex | None = None
+        if matches is not None:
+            matches = list(matches)
+            self._index = TimeIndex(matches, repo.event.venues)
+            if standings is None:
+                standings = StandingsTracker(repo.event, matches)
+        self._standings = standings
+        self._upcoming_limit = upcoming_limit
+        self._highlight_limit = highlight_limit
+        self._highlight_threshold = highlight_threshold
+        self._rows: Dict[str, Tuple[tuple, List[list]]] = {}
+        self._rendered: Dict[Tuple[str, str], Tuple[tuple, str]] = {}
+
+    def render(self, fmt: str = "text", now: datetime | int | None = None) -> str:
+        return "".join(self.iter_render(fmt, now))
+
+    def iter_render(self, fmt: str = "text", now: datetime | int | None = None) -> Iterator[str]:
+        """
+        Yield the report in chunks, one cached section at a time.
+
+        ``now`` is an aware datetime, a naive UTC datetime, or UTC epoch seconds;
+        match times are compared in UTC using each venue's timezone.
+        """
+        _check_format(fmt)
+        if now is None:
+            now = now_epoch()
+        elif isinstance(now, datetime):
+            now = to_epoch(now)
+        event = self._repo.event
+        sections = [
+            (name, self._section(name, fmt, now))
+            for name in REPORT_SECTIONS
+            if not (fmt == "text" and name == "highlights" and not self._section_rows(name, now))
+        ]
+
+        if fmt == "text":
+            yield f"Event: {event.name} ({event.start_date} to {event.end_date})\n"
+            yield "\n\n".join(body for _, body in sections)
+        elif fmt == "json":
+            yield "{" + f'"event": {json.dumps(_event_header(event))}'
+            for name, body in sections:
+                yield f', "{name}": {body}'
+            yield "}"
+        elif fmt == "csv":
+            yield _csv_line(["event", event.id, event.name, str(event.start_date), str(event.end_date)])
+            for _, body in sections:
+                yield "\n" + body
+        else:
+            yield (
+                "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+                f"<title>{html.escape(event.name)}</title></head><body>\n"
+                f"<h1>{html.escape(event.name)}</h1>\n"
+                f"<p>{event.start_date} to {event.end_date}</p>\n"
             )
+            for _, body in sections:
+                yield body
+            yield "</body></html>\n"
+
+    def iter_full_schedule(self, fmt: str = "text") -> Iterator[str]:
+        """Stream every match in chronological order without building one large string."""
+        _check_format(fmt)
+        ordered = self._time_index().matches
+        teams = self._repo.event.teams
+        header = _COLUMNS["schedule"]
+        if fmt == "csv":
+            yield _csv_line(header)
+        elif fmt == "json":
+            yield "["
+        elif fmt == "html":
+            yield "<table>\n" + _html_row(header, "th")
+        for position, match in enumerate(ordered):
+            row = _schedule_row(match, teams)
+            if fmt == "text":
+                yield _format_schedule_line(row) + "\n"
+            elif fmt == "csv":
+                yield _csv_line(row)
+            elif fmt == "json":
+                yield ("" if position == 0 else ", ") + json.dumps(dict(zip(header, row)))
+            else:
+                yield _html_row(row, "td")
+        if fmt == "json":
+            yield "]"
+        elif fmt == "html":
+            yield "</table>\n"
+
+    def _section(self, name: str, fmt: str, now: int) -> str:
+        key = self._key(name, now)
+        cached = self._rendered.get((name, fmt))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        body = _RENDERERS[fmt](self, name, self._section_rows(name, now))
+        self._rendered[(name, fmt)] = (key, body)
+        return body
+
+    def _section_rows(self, name: str, now: int) -> List[list]:
+        key = self._key(name, now)
+        cached = self._rows.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        rows = _BUILDERS[name](self, now)
+        self._rows[name] = (key, rows)
+        return rows
+
+    def _key(self, name: str, now: int) -> tuple:
+        key = tuple(self._repo.version(kind) for kind in _SECTION_INPUTS[name])
+        if name == "schedule":
+            key += (self._time_index().position(now),)
+        return key
+
+    def _time_index(self) -> TimeIndex:
+        return self._index if self._index is not None else self._repo.time_index()
+
+    def _build_teams(self, now: int) -> List[list]:
+        return [
+            [team.id, team.name, round(team.average_rating, 1)]
+            for team in sorted(self._repo.event.teams.values(), key=lambda t: t.name)
+        ]
+
+    def _build_schedule(self, now: int) -> List[list]:
+        teams = self._repo.event.teams
+        return [_schedule_row(m, teams) for m in self._time_index().upcoming(now, self._upcoming_limit)]
+
+    def _build_standings(self, now: int) -> List[list]:
+        event = self._repo.event
+        standings = self._standings.standings() if self._standings is not None else compute_standings(event)
+        if not any(perf.matches_played for perf in standings):
+            return []
+        return [_standings_row(event, perf) for perf in standings]
+
+    def _build_highlights(self, now: int) -> List[list]:
+        event = self._repo.event
+        return [
+            [m.id, m.scheduled_time.date().isoformat(), event.teams[m.team_one_id].name,
+             event.teams[m.team_two_id].name, m.stage]
+            for m in suggest_highlight_matches(event, self._highlight_threshold)[: self._highlight_limit]
+        ]
 
-    return "\n".join(report_lines)
+    def _render_text(self, name: str, rows: List[list]) -> str:
+        if name == "teams":
+            lines = [f"Teams ({len(self._repo.event.teams)} total):"]
+            lines += [f"  - {team_name} [{team_id}] | Avg Rating: {rating:.1f}" for team_id, team_name, rating in rows]
+        elif name == "schedule":
+            lines = ["Upcoming Schedule:"]
+            lines += [_format_schedule_line(row) for row in rows] or ["  No remaining scheduled matches."]
+        elif name == "standings":
+            lines = ["Standings:"]
+            lines += _format_standings_rows(rows) if rows else ["  No completed matches yet."]
+        else:
+            lines = ["Predicted Close Matchups:"]
+            lines += [f"  {one} vs {two} on {day} (Stage {stage})" for _, day, one, two, stage in rows]
+        return "\n".join(lines)
 
+    def _render_json(self, name: str, rows: List[list]) -> str:
+        columns = _COLUMNS[name]
+        return json.dumps([dict(zip(columns, row)) for row in rows])
 
-def _format_standings_table(event: Event, standings: List[TeamPerformance]) -> List[str]:
-    rows = [
+    def _render_csv(self, name: str, rows: List[list]) -> str:
+        return _csv_line([name]) + _csv_line(_COLUMNS[name]) + "".join(_csv_line(row) for row in rows)
+
+    def _render_html(self, name: str, rows: List[list]) -> str:
+        return (
+            f"<h2>{_SECTION_TITLES[name]}</h2>\n<table>\n"
+            + _html_row(_COLUMNS[name], "th")
+            + "".join(_html_row(row, "td") for row in rows)
+            + "</table>\n"
+        )
+
+
+_BUILDERS: Dict[str, Callable[[ReportRenderer, int], List[list]]] = {
+    "teams": ReportRenderer._build_teams,
+    "schedule": ReportRenderer._build_schedule,
+    "standings": ReportRenderer._build_standings,
+    "highlights": ReportRenderer._build_highlights,
+}
+_RENDERERS: Dict[str, Callable[[ReportRenderer, str, List[list]], str]] = {
+    "text": ReportRenderer._render_text,
+    "json": ReportRenderer._render_json,
+    "csv": ReportRenderer._render_csv,
+    "html": ReportRenderer._render_html,
+}
+
+
+def _check_format(fmt: str) -> None:
+    if fmt not in REPORT_FORMATS:
+        raise ValueError(f"Unsupported report format: {fmt}")
+
+
+def _event_header(event: Event) -> dict:
+    return {
+        "id": event.id,
+        "name": event.name,
+        "start_date": event.start_date.isoformat(),
+        "end_date": event.end_date.isoformat(),
+    }
+
+
+def _schedule_row(match: Match, teams: dict) -> list:
+    return [
+        match.id,
+        match.scheduled_time.isoformat(),
+        teams[match.team_one_id].name,
+        teams[match.team_two_id].name,
+        match.stage,
+        match.round_number,
+        match.venue_id,
+    ]
+
+
+def _format_schedule_line(row: list) -> str:
+    _, scheduled, one, two, stage, round_number, _ = row
+    return f"  {scheduled} | {one} vs {two} (Stage: {stage}, Round: {round_number})"
+
+
+def _standings_row(event: Event, perf: TeamPerformance) -> list:
+    return [
+        perf.team_id,
+        event.teams[perf.team_id].name,
+        perf.wins,
+        perf.losses,
+        perf.ties,
+        perf.map_difference,
+        round(perf.win_rate, 4),
+    ]
+
+
+def _format_standings_rows(rows: List[list]) -> List[str]:
+    lines = [
         "  Team                          W   L   T   Maps   Win%"
     ]
-    for perf in standings:
-        team_name = event.teams[perf.team_id].name
-        rows.append(
-            f"  {team_name:<28} {perf.wins:>2}  {perf.losses:>2}  {perf.ties:>2}  "
-            f"{perf.map_difference:>+3}   {perf.win_rate*100:5.1f}"
+    for _, team_name, wins, losses, ties, map_difference, win_rate in rows:
+        lines.append(
+            f"  {team_name:<28} {wins:>2}  {losses:>2}  {ties:>2}  "
+            f"{map_difference:>+3}   {win_rate*100:5.1f}"
         )
-    return rows
+    return lines
+
+
+def _csv_line(row: list) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(row)
+    return buffer.getvalue()
+
 
+def _html_row(row: list, cell: str) -> str:
+    cells = "".join(f"<{cell}>{html.escape('' if value is None else str(value))}</{cell}>" for value in row)
+    return f"<tr>{cells}</tr>\n"
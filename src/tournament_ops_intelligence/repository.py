@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import gc
 import json
+import os
+import tempfile
+from dataclasses import replace
 from datetime import date, datetime
+from json.encoder import encode_basestring_ascii as _json_str
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
-from .models import Event, Match, MatchResult, Player, Team, Venue
+from .models import Event, Match, MatchResult, Player, SeriesState, Team, Venue, validate_series_score
+from .timeutils import TimeIndex, parse_datetime, zone_for
 
 
 def _parse_datetime(value: str) -> datetime:
     try:
-        return datetime.fromisoformat(value)
+        return parse_datetime(value)
     except ValueError as exc:  # pragma: no cover - close error message
         raise ValueError(f"Invalid datetime format: {value}") from exc
 
@@ -22,11 +28,16 @@ def _parse_date(value: str) -> date:
         raise ValueError(f"Invalid date format: {value}") from exc
 
 
+VERSIONED_DATA = ("teams", "matches", "results")
+
+
 class TournamentRepository:
     """Loads and stores tournament data."""
 
     def __init__(self, event: Event):
         self._event = event
+        self._versions = {kind: 0 for kind in VERSIONED_DATA}
+        self._time_index: tuple[int, TimeIndex] | None = None
 
     @property
     def event(self) -> Event:
@@ -34,10 +45,36 @@ class TournamentRepository:
 
     @classmethod
     def from_json(cls, path: Path | str) -> "TournamentRepository":
-        raw_data = json.loads(Path(path).read_text())
-        event = _event_from_dict(raw_data)
+        # Loading allocates one object per match and result but frees nothing, so
+        # cyclic GC passes during the load are pure overhead.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            raw_data = json.loads(Path(path).read_text())
+            event = _event_from_dict(raw_data)
+        finally:
+            if gc_enabled:
+                gc.enable()
         return cls(event)
 
+    def version(self, kind: str) -> int:
+        """Change counter for one kind of event data ("teams", "matches" or "results")."""
+        return self._versions[kind]
+
+    def mark_changed(self, *kinds: str) -> None:
+        """Bump change counters after mutating event data in place."""
+        for kind in kinds:
+            if kind not in self._versions:
+                raise ValueError(f"Unknown data kind: {kind}")
+            self._versions[kind] += 1
+
+    def time_index(self) -> TimeIndex:
+        """Matches ordered by UTC start time, rebuilt only when the match list changes."""
+        version = self._versions["matches"]
+        if self._time_index is None or self._time_index[0] != version:
+            self._time_index = (version, TimeIndex(self._event.matches, self._event.venues))
+        return self._time_index[1]
+
     def to_dict(self) -> dict:
         return _event_to_dict(self._event)
 
@@ -56,6 +93,7 @@ class TournamentRepository:
         existing = {match.id: match for match in self._event.matches}
         existing.update(matches_by_id)
         self._event.matches = list(sorted(existing.values(), key=lambda m: (m.stage, m.round_number, m.scheduled_time)))
+        self.mark_changed("matches", "results")
 
     def record_results(self, results: Iterable[MatchResult]) -> None:
         matches_by_id = {match.id: match for match in self._event.matches}
@@ -64,9 +102,46 @@ class TournamentRepository:
             if match is None:
                 continue
             match.result = result
+        self.mark_changed("results")
 
-    def save_json(self, path: Path | str) -> None:
-        Path(path).write_text(json.dumps(self.to_dict(), indent=2, sort_keys=True))
+    def update_series(self, match_id: str, team_one_maps: int, team_two_maps: int) -> Match:
+        """Record the live map score of an in-progress series."""
+        for match in self._event.matches:
+            if match.id == match_id:
+                validate_series_score(match.best_of, team_one_maps, team_two_maps)
+                match.series_state = SeriesState(team_one_maps=team_one_maps, team_two_maps=team_two_maps)
+                self.mark_changed("results")
+                return match
+        raise KeyError(match_id)
+
+    def save_json(self, path: Path | str, compact: bool = False) -> None:
+        """
+        Stream the event to ``path`` through a temp file that atomically replaces it.
+
+        The default layout is identical to ``json.dumps(self.to_dict(), indent=2,
+        sort_keys=True)``; ``compact`` drops all optional whitespace. An existing
+        file keeps its permission bits; new files are created 0644.
+        """
+        target = Path(path)
+        try:
+            mode = os.stat(target).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = 0o644
+        fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        try:
+            try:
+                handle = open(fd, "w", encoding="utf-8")
+            except BaseException:
+                os.close(fd)
+                raise
+            with handle:
+                handle.writelines(_iter_event_json(self._event, compact))
+            os.chmod(temp_name, mode)
+            os.replace(temp_name, target)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+            raise
 
 
 def _event_from_dict(payload: dict) -> Event:
@@ -101,6 +176,11 @@ def _event_from_dict(payload: dict) -> Event:
         )
         for venue_data in payload.get("venues", [])
     }
+    for venue in venues.values():
+        try:
+            zone_for(venue.timezone)
+        except ValueError as exc:
+            raise ValueError(f"Venue {venue.id} has an unknown timezone: {venue.timezone}") from exc
 
     matches: List[Match] = []
     for match_data in payload.get("matches", []):
@@ -115,6 +195,13 @@ def _event_from_dict(payload: dict) -> Event:
                 concluded_at=_parse_datetime(res_payload["concluded_at"]) if res_payload.get("concluded_at") else None,
                 notes=res_payload.get("notes"),
             )
+        series_state: SeriesState | None = None
+        if match_data.get("series_state") is not None:
+            state_payload = match_data["series_state"]
+            series_state = SeriesState(
+                team_one_maps=int(state_payload.get("team_one_maps", 0)),
+                team_two_maps=int(state_payload.get("team_two_maps", 0)),
+            )
         matches.append(
             Match(
                 id=match_data["id"],
@@ -126,6 +213,7 @@ def _event_from_dict(payload: dict) -> Event:
                 best_of=int(match_data.get("best_of", 1)),
                 venue_id=match_data.get("venue_id"),
                 result=result,
+                series_state=series_state,
             )
         )
 
@@ -201,7 +289,91 @@ def _event_to_dict(event: Event) -> dict:
                     else None,
                     "notes": match.result.notes,
                 },
+                "series_state": None
+                if match.series_state is None
+                else {
+                    "team_one_maps": match.series_state.team_one_maps,
+                    "team_two_maps": match.series_state.team_two_maps,
+                },
             }
             for match in event.matches
         ],
     }
+
+
+def _iter_event_json(event: Event, compact: bool) -> Iterator[str]:
+    """Yield the JSON document for ``event`` piece by piece, keys in sorted order."""
+
+    def newline(level: int) -> str:
+        return "" if compact else "\n" + "  " * level
+
+    def dump(value: object, level: int) -> str:
+        if compact:
+            return json.dumps(value, sort_keys=True, separators=(",", ":"))
+        return json.dumps(value, indent=2, sort_keys=True).replace("\n", newline(level))
+
+    colon = ":" if compact else ": "
+    header = {
+        "id": event.id,
+        "name": event.name,
+        "start_date": event.start_date.isoformat(),
+        "end_date": event.end_date.isoformat(),
+    }
+    yield "{" + newline(1) + f'"event"{colon}' + dump(header, 1) + "," + newline(1) + f'"matches"{colon}'
+
+    if not event.matches:
+        yield "[]"
+    else:
+        # Matches dominate file size, so they are formatted from fixed templates
+        # rather than going through a per-match dict.
+        field = "," + newline(3)
+        nested_field = "," + newline(4)
+        open_match = "{" + newline(3)
+        close_match = newline(2) + "}"
+        open_nested = "{" + newline(4)
+        close_nested = newline(3) + "}"
+        separator = "," + newline(2)
+        yield "[" + newline(2)
+        first = True
+        for match in event.matches:
+            result = match.result
+            if result is None:
+                result_json = "null"
+            else:
+                concluded = _json_str(result.concluded_at.isoformat()) if result.concluded_at else "null"
+                notes = "null" if result.notes is None else _json_str(result.notes)
+                result_json = (
+                    f'{open_nested}"concluded_at"{colon}{concluded}'
+                    f'{nested_field}"match_id"{colon}{_json_str(result.match_id)}'
+                    f'{nested_field}"notes"{colon}{notes}'
+                    f'{nested_field}"team_one_score"{colon}{int(result.team_one_score)}'
+                    f'{nested_field}"team_two_score"{colon}{int(result.team_two_score)}'
+                    f'{nested_field}"winner_id"{colon}{_json_str(result.winner_id)}{close_nested}'
+                )
+            state = match.series_state
+            state_json = (
+                "null"
+                if state is None
+                else f'{open_nested}"team_one_maps"{colon}{int(state.team_one_maps)}'
+                f'{nested_field}"team_two_maps"{colon}{int(state.team_two_maps)}{close_nested}'
+            )
+            venue = "null" if match.venue_id is None else _json_str(match.venue_id)
+            yield (
+                f'{"" if first else separator}{open_match}"best_of"{colon}{int(match.best_of)}'
+                f'{field}"id"{colon}{_json_str(match.id)}'
+                f'{field}"result"{colon}{result_json}'
+                f'{field}"round_number"{colon}{int(match.round_number)}'
+                f'{field}"scheduled_time"{colon}{_json_str(match.scheduled_time.isoformat())}'
+                f'{field}"series_state"{colon}{state_json}'
+                f'{field}"stage"{colon}{_json_str(match.stage)}'
+                f'{field}"team_one_id"{colon}{_json_str(match.team_one_id)}'
+                f'{field}"team_two_id"{colon}{_json_str(match.team_two_id)}'
+                f'{field}"venue_id"{colon}{venue}{close_match}'
+            )
+            first = False
+        yield newline(1) + "]"
+
+    payload = _event_to_dict(replace(event, matches=[]))
+    for key in ("metadata", "teams", "venues"):
+        yield "," + newline(1) + f'"{key}"{colon}' + dump(payload[key], 1)
+    yield newline(0) + "}"
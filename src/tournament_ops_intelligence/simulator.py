@@ -23,7 +23,14 @@ def simulate_matches(event: Event, matches: Iterable[Match] | None = None, seed:
             simulated.append(match)
             continue
         win_probability, _ = expected_score(event, match.team_one_id, match.team_two_id)
-        team_one_wins, team_two_wins = _play_series(match.best_of, win_probability, rng)
+        state = match.series_state
+        team_one_wins, team_two_wins = _play_series(
+            match.best_of,
+            win_probability,
+            rng,
+            state.team_one_maps if state else 0,
+            state.team_two_maps if state else 0,
+        )
         if team_one_wins == team_two_wins:
             # For best-of-one ties we record as draw; otherwise assign final game.
             if match.best_of == 1:
@@ -44,14 +51,15 @@ def simulate_matches(event: Event, matches: Iterable[Match] | None = None, seed:
             team_two_score=team_two_wins,
             concluded_at=match.scheduled_time + timedelta(minutes=45 * match.best_of),
         )
-        simulated.append(replace(match, result=result))
+        simulated.append(replace(match, result=result, series_state=None))
     return simulated
 
 
-def _play_series(best_of: int, win_probability: float, rng: random.Random) -> tuple[int, int]:
+def _play_series(
+    best_of: int, win_probability: float, rng: random.Random, wins_one: int = 0, wins_two: int = 0
+) -> tuple[int, int]:
+    """Play out the remaining maps of a series, starting from the given map score."""
     required_wins = best_of // 2 + 1
-    wins_one = 0
-    wins_two = 0
     while wins_one < required_wins and wins_two < required_wins:
         if rng.random() < win_probability:
             wins_one += 1
@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta, tzinfo
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from .models import Event, Match, Venue
+from .scheduler import _generate_round_robin_pairings
+from .timeutils import to_epoch, zone_for
+
+
+@dataclass(slots=True)
+class StageSpec:
+    """A single stage of a multi-stage schedule."""
+
+    stage: str
+    groups: Sequence[Sequence[str]] | None = None
+    double_round_robin: bool = False
+    best_of: int = 3
+
+
+@dataclass(slots=True)
+class SlotScheduleRequest:
+    stages: Sequence[StageSpec]
+    start_time: datetime
+    match_duration_minutes: int = 60
+    changeover_minutes: int = 0
+    blocks_per_day: int = 4
+    rest_minutes: int = 0
+    venue_ids: Sequence[str] | None = None
+    venue_hours: Mapping[str, Tuple[time, time]] | None = None
+    team_unavailability: Mapping[str, Sequence[Tuple[datetime, datetime]]] | None = None
+    max_days: int = 3650
+    local_search_passes: int = 3
+
+
+@dataclass(slots=True)
+class ScheduleMetrics:
+    matches: int = 0
+    days: int = 0
+    blocks_spanned: int = 0
+    venue_slots_open: int = 0
+    venue_slots_used: int = 0
+    venue_utilisation: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def utilisation(self) -> float:
+        return self.venue_slots_used / self.venue_slots_open if self.venue_slots_open else 0.0
+
+
+@dataclass(slots=True)
+class SlotSchedule:
+    matches: List[Match]
+    metrics: ScheduleMetrics
+
+
+def build_slot_schedule(event: Event, request: SlotScheduleRequest) -> SlotSchedule:
+    """
+    Pack matches into concurrent venue slots, one time block per match duration.
+
+    Matches are placed greedily in round order at the earliest block where both
+    teams are rested and available and a venue is open, then a local search pass
+    pulls late matches into earlier gaps. Stages run one after another.
+
+    Naive ``start_time`` and unavailability windows are wall-clock times in the
+    venues' timezone, as for stored match times; when the venues span several
+    timezones they must be timezone-aware.
+    """
+    venue_ids = list(request.venue_ids) if request.venue_ids else list(event.venues.keys())
+    grid = _BlockGrid(event, request, venue_ids)
+
+    schedule: List[Match] = []
+    placements: List[int] = []
+    stage_floors: List[int] = []
+    stage_floor = 0
+    for spec in request.stages:
+        stage_start = len(schedule)
+        slug = spec.stage.lower().replace(" ", "-")
+        for match_counter, (round_number, team_one_id, team_two_id) in enumerate(
+            _stage_pairings(event, spec), start=1
+        ):
+            match_id = f"{slug}-r{round_number:02d}-m{match_counter:03d}"
+            block = grid.place(match_id, team_one_id, team_two_id, stage_floor)
+            schedule.append(
+                Match(
+                    id=match_id,
+                    stage=spec.stage,
+                    round_number=round_number,
+                    team_one_id=team_one_id,
+                    team_two_id=team_two_id,
+                    scheduled_time=grid.block_time(block),
+                    best_of=spec.best_of,
+                )
+            )
+            placements.append(block)
+            stage_floors.append(stage_floor)
+        if len(schedule) > stage_start:
+            stage_floor = max(placements[stage_start:]) + 1
+
+    for _ in range(max(0, request.local_search_passes)):
+        if not grid.compact(schedule, placements, stage_floors):
+            break
+
+    for match, block in zip(schedule, placements):
+        match.venue_id = grid.venue_for(match.id)
+        match.scheduled_time = grid.block_time(block)
+
+    order = sorted(range(len(schedule)), key=lambda i: (placements[i], schedule[i].venue_id or ""))
+    schedule = [schedule[i] for i in order]
+    return SlotSchedule(matches=schedule, metrics=grid.metrics(placements))
+
+
+def _stage_pairings(event: Event, spec: StageSpec) -> List[Tuple[int, str, str]]:
+    """Flatten a stage into (round, team_one, team_two) triples with groups interleaved by round."""
+    groups = [list(group) for group in spec.groups] if spec.groups else [sorted(event.teams.keys())]
+    rounds_by_group: List[List[List[Tuple[str, str]]]] = []
+    for group in groups:
+        for team_id in group:
+            if team_id not in event.teams:
+                raise ValueError(f"Unknown team id in stage {spec.stage}: {team_id}")
+        rounds = [
+            [(one, two) for one, two in pairings if two is not None]
+            for pairings in _generate_round_robin_pairings(sorted(group))
+        ] if len(group) >= 2 else []
+        if spec.double_round_robin:
+            rounds += [[(two, one) for one, two in pairings] for pairings in rounds]
+        rounds_by_group.append(rounds)
+
+    triples: List[Tuple[int, str, str]] = []
+    total_rounds = max((len(rounds) for rounds in rounds_by_group), default=0)
+    for round_index in range(total_rounds):
+        for rounds in rounds_by_group:
+            if round_index < len(rounds):
+                triples.extend((round_index + 1, one, two) for one, two in rounds[round_index])
+    return triples
+
+
+class _BlockGrid:
+    """Time blocks with per-venue free slots and per-team occupancy, grown lazily."""
+
+    def __init__(self, event: Event, request: SlotScheduleRequest, venue_ids: Sequence[str]):
+        self._start = request.start_time
+        self._step = timedelta(minutes=request.match_duration_minutes + request.changeover_minutes)
+        self._duration = request.match_duration_minutes * 60
+        self._gap = (request.match_duration_minutes + request.rest_minutes) * 60
+        self._blocks_per_day = max(1, request.blocks_per_day)
+        if self._blocks_per_day * (request.match_duration_minutes + request.changeover_minutes) > 24 * 60:
+            raise ValueError(
+                f"{self._blocks_per_day} blocks of "
+                f"{request.match_duration_minutes + request.changeover_minutes} minutes do not fit in one day."
+            )
+        self._max_blocks = request.max_days * self._blocks_per_day
+        self._venue_ids = list(venue_ids)
+        self._hours = {
+            venue_id: _venue_hours(event.venues.get(venue_id), (request.venue_hours or {}).get(venue_id))
+            for venue_id in self._venue_ids
+        }
+        timezones = {
+            venue_id: event.venues[venue_id].timezone if venue_id in event.venues else "UTC"
+            for venue_id in self._venue_ids
+        }
+        self._zones = {venue_id: zone_for(name) for venue_id, name in timezones.items()}
+        # Naive inputs are read in the venues' shared timezone, matching timeutils.match_epoch.
+        distinct = set(timezones.values()) or {"UTC"}
+        self._local_tz = distinct.pop() if len(distinct) == 1 else None
+        self._unavailable = {
+            team_id: [(self._epoch(start), self._epoch(end)) for start, end in windows]
+            for team_id, windows in (request.team_unavailability or {}).items()
+        }
+        self._epoch(self._start)  # reject an ambiguous naive start up front
+
+        self._times: List[datetime] = []
+        self._epochs: List[int] = []
+        self._open: List[int] = []
+        self._free: List[List[str | None]] = []
+        self._free_blocks: List[int] = []
+        self._team_blocks: Dict[str, List[int]] = {}
+        self._venue_use: Counter = Counter()
+        self._match_venues: Dict[str, str | None] = {}
+
+    def block_time(self, block: int) -> datetime:
+        return self._times[block]
+
+    def venue_for(self, match_id: str) -> str | None:
+        return self._match_venues.get(match_id)
+
+    def place(self, match_id: str, team_one_id: str, team_two_id: str, floor: int) -> int:
+        block = max(floor, self._earliest_after(team_one_id), self._earliest_after(team_two_id))
+        while True:
+            index = bisect_left(self._free_blocks, block)
+            while index == len(self._free_blocks):
+                self._extend()
+                index = bisect_left(self._free_blocks, block)
+            block = self._free_blocks[index]
+            if self._fits(team_one_id, block) and self._fits(team_two_id, block):
+                break
+            block += 1
+        self._occupy(block, match_id, team_one_id, team_two_id)
+        return block
+
+    def compact(self, schedule: List[Match], placements: List[int], floors: List[int]) -> bool:
+        """Move matches into the earliest feasible earlier block; return True if anything moved."""
+        moved = False
+        for index in sorted(range(len(schedule)), key=lambda i: placements[i], reverse=True):
+            match = schedule[index]
+            current = placements[index]
+            one, two = match.team_one_id, match.team_two_id
+            self._release(current, match)
+            lower = max(floors[index], self._earliest_before(one, current), self._earliest_before(two, current))
+            target = current
+            position = bisect_left(self._free_blocks, lower)
+            while position < len(self._free_blocks):
+                block = self._free_blocks[position]
+                if block >= current:
+                    break
+                if self._fits(one, block) and self._fits(two, block):
+                    target = block
+                    break
+                position += 1
+            self._occupy(target, match.id, one, two)
+            placements[index] = target
+            moved = moved or target != current
+        return moved
+
+    def metrics(self, placements: Sequence[int]) -> ScheduleMetrics:
+        if not placements:
+            return ScheduleMetrics()
+        first, last = min(placements), max(placements)
+        open_by_venue: Counter = Counter()
+        for block in range(first, last + 1):
+            for position, venue_id in enumerate(self._venue_ids):
+                if self._open[block] & (1 << position):
+                    open_by_venue[venue_id] += 1
+        return ScheduleMetrics(
+            matches=len(placements),
+            days=last // self._blocks_per_day - first // self._blocks_per_day + 1,
+            blocks_spanned=last - first + 1,
+            venue_slots_open=sum(open_by_venue.values()),
+            venue_slots_used=len(placements),
+            venue_utilisation={
+                venue_id: (self._venue_use[venue_id] / open_by_venue[venue_id]) if open_by_venue[venue_id] else 0.0
+                for venue_id in self._venue_ids
+            },
+        )
+
+    def _extend(self) -> None:
+        if len(self._times) >= self._max_blocks:
+            raise ValueError("No feasible slot within the scheduling horizon; check venue hours and availability.")
+        day = len(self._times) // self._blocks_per_day
+        day_start = self._start + timedelta(days=day)
+        for slot in range(self._blocks_per_day):
+            block_time = day_start + slot * self._step
+            epoch = self._epoch(block_time)
+            free: List[str | None] = []
+            mask = 0
+            for position, venue_id in enumerate(self._venue_ids):
+                if _is_open(epoch, self._duration, self._zones[venue_id], self._hours[venue_id]):
+                    free.append(venue_id)
+                    mask |= 1 << position
+            if not self._venue_ids:
+                free.append(None)
+            block = len(self._times)
+            self._times.append(block_time)
+            self._epochs.append(epoch)
+            self._open.append(mask)
+            self._free.append(free)
+            if free:
+                self._free_blocks.append(block)
+
+    def _epoch(self, value: datetime) -> int:
+        if value.tzinfo is None and self._local_tz is None:
+            raise ValueError(
+                "Venues span several timezones; start_time and unavailability windows must be timezone-aware."
+            )
+        return to_epoch(value, self._local_tz or "UTC")
+
+    def _earliest_after(self, team_id: str) -> int:
+        blocks = self._team_blocks.get(team_id)
+        if not blocks:
+            return 0
+        return self._first_block_at(self._epochs[blocks[-1]] + self._gap)
+
+    def _earliest_before(self, team_id: str, current: int) -> int:
+        blocks = self._team_blocks.get(team_id, [])
+        position = bisect_left(blocks, current)
+        if position == 0:
+            return 0
+        return self._first_block_at(self._epochs[blocks[position - 1]] + self._gap)
+
+    def _first_block_at(self, epoch: int) -> int:
+        while not self._epochs or self._epochs[-1] < epoch:
+            self._extend()
+        return bisect_left(self._epochs, epoch)
+
+    def _fits(self, team_id: str, block: int) -> bool:
+        epoch = self._epochs[block]
+        for start, end in self._unavailable.get(team_id, ()):
+            if start < epoch + self._duration and epoch < end:
+                return False
+        blocks = self._team_blocks.get(team_id)
+        if not blocks:
+            return True
+        position = bisect_left(blocks, block)
+        if position < len(blocks) and self._epochs[blocks[position]] - epoch < self._gap:
+            return False
+        if position > 0 and epoch - self._epochs[blocks[position - 1]] < self._gap:
+            return False
+        return True
+
+    def _occupy(self, block: int, match_id: str, team_one_id: str, team_two_id: str) -> None:
+        free = self._free[block]
+        venue_id = min(free, key=lambda v: self._venue_use[v]) if len(free) > 1 else free[0]
+        free.remove(venue_id)
+        if not free:
+            del self._free_blocks[bisect_left(self._free_blocks, block)]
+        self._venue_use[venue_id] += 1
+        insort(self._team_blocks.setdefault(team_one_id, []), block)
+        insort(self._team_blocks.setdefault(team_two_id, []), block)
+        self._match_venues[match_id] = venue_id
+
+    def _release(self, block: int, match: Match) -> None:
+        venue_id = self._match_venues.pop(match.id)
+        free = self._free[block]
+        if not free:
+            insort(self._free_blocks, block)
+        free.append(venue_id)
+        self._venue_use[venue_id] -= 1
+        for team_id in (match.team_one_id, match.team_two_id):
+            blocks = self._team_blocks[team_id]
+            del blocks[bisect_left(blocks, block)]
+
+
+def _venue_hours(venue: Venue | None, override: Tuple[time, time] | None) -> Tuple[time, time] | None:
+    if override is not None:
+        return override
+    if venue is None or "opens_at" not in venue.metadata or "closes_at" not in venue.metadata:
+        return None
+    return time.fromisoformat(venue.metadata["opens_at"]), time.fromisoformat(venue.metadata["closes_at"])
+
+
+def _is_open(epoch: int, duration: int, zone: tzinfo, hours: Tuple[time, time] | None) -> bool:
+    """Whether a block fits inside the venue's opening hours in its local timezone."""
+    if hours is None:
+        return True
+    opens, closes = hours
+    start = datetime.fromtimestamp(epoch, zone)
+    end = datetime.fromtimestamp(epoch + duration, zone)
+    start_minutes = start.hour * 60 + start.minute
+    end_minutes = start_minutes + (end - start).seconds // 60
+    open_minutes = opens.hour * 60 + opens.minute
+    close_minutes = closes.hour * 60 + closes.minute
+    if close_minutes <= open_minutes:
+        close_minutes += 24 * 60
+        if start_minutes < open_minutes:
+            start_minutes += 24 * 60
+            end_minutes += 24 * 60
+    return open_minutes <= start_minutes and end_minutes <= close_minutes
+
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import time
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Sequence
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .models import Match, Venue
+
+
+@lru_cache(maxsize=8192)
+def parse_datetime(value: str) -> datetime:
+    """``datetime.fromisoformat`` memoised for the handful of slot timestamps schedules repeat."""
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=None)
+def zone_for(name: str) -> ZoneInfo | timezone:
+    if name == "UTC":
+        return timezone.utc
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError) as exc:
+        raise ValueError(f"Unknown timezone: {name}") from exc
+
+
+@lru_cache(maxsize=8192)
+def to_epoch(value: datetime, tz: str = "UTC") -> int:
+    """
+    UTC epoch seconds for ``value``.
+
+    Aware datetimes keep their own offset; naive ones are read as wall-clock time
+    in ``tz`` (a venue's ``timezone``).
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=zone_for(tz))
+    return int(value.timestamp())
+
+
+def now_epoch() -> int:
+    return int(time.time())
+
+
+def match_epoch(match: Match, venues: Dict[str, Venue]) -> int:
+    venue = venues.get(match.venue_id) if match.venue_id is not None else None
+    return to_epoch(match.scheduled_time, venue.timezone if venue is not None else "UTC")
+
+
+class TimeIndex:
+    """Matches ordered by UTC start time, answering upcoming and window queries by bisection."""
+
+    def __init__(self, matches: Sequence[Match], venues: Dict[str, Venue]):
+        epochs = [match_epoch(match, venues) for match in matches]
+        order = sorted(range(len(matches)), key=epochs.__getitem__)
+        self._epochs = array("q", [epochs[i] for i in order])
+        self._matches = [matches[i] for i in order]
+
+    def __len__(self) -> int:
+        return len(self._matches)
+
+    @property
+    def matches(self) -> List[Match]:
+        return self._matches
+
+    @property
+    def epochs(self) -> array:
+        return self._epochs
+
+    def position(self, when: datetime | int | None = None) -> int:
+        """Index of the first match starting at or after ``when`` (default: now)."""
+        return bisect_left(self._epochs, _as_epoch(when))
+
+    def upcoming(self, now: datetime | int | None = None, limit: int | None = None) -> List[Match]:
+        start = self.position(now)
+        end = len(self._matches) if limit is None else start + limit
+        return self._matches[start:end]
+
+    def in_window(self, start: datetime | int, end: datetime | int) -> List[Match]:
+        """Matches starting in ``[start, end)``."""
+        return self._matches[self.position(start) : self.position(end)]
+
+
+def _as_epoch(when: datetime | int | None) -> int:
+    if when is None:
+        return now_epoch()
+    if isinstance(when, datetime):
+        return to_epoch(when)
+    return int(when)
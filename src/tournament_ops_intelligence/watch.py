@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Sequence, Tuple
+
+from .analytics import StandingsTracker
+from .models import Event, Match
+from .reports import ReportRenderer
+from .repository import TournamentRepository
+
+_Signature = Tuple[int, int, int]
+
+
+class WatchedEvent:
+    """
+    An event file whose report is refreshed only when the file changes.
+
+    Changes are detected from ``os.stat`` (mtime, size, inode). When teams, venues,
+    and event details are unchanged, the old and new match lists are diffed and only
+    changed results are applied to the cached standings; report sections whose
+    inputs did not change keep their cached output.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._signature: _Signature | None = None
+        self._repo: TournamentRepository | None = None
+        self._tracker: StandingsTracker | None = None
+        self._renderer: ReportRenderer | None = None
+
+    @property
+    def repo(self) -> TournamentRepository | None:
+        return self._repo
+
+    def refresh(self) -> bool:
+        """Reload the file if it changed since the last successful load; return True if it did."""
+        signature = _stat_signature(self.path)
+        if signature is None or signature == self._signature:
+            return False
+        try:
+            event = TournamentRepository.from_json(self.path).event
+            _check_team_ids(event)
+        except (OSError, ValueError, KeyError):
+            # Most likely caught mid-write or mid-edit; try again on the next poll.
+            return False
+        self._signature = signature
+        if self._repo is None or not self._apply_changes(event):
+            self._repo = TournamentRepository(event)
+            self._tracker = StandingsTracker(event)
+            self._renderer = ReportRenderer(self._repo, standings=self._tracker)
+        return True
+
+    def iter_render(self, fmt: str = "text", now: datetime | int | None = None) -> Iterator[str]:
+        if self._renderer is None:
+            return iter(())
+        return self._renderer.iter_render(fmt, now)
+
+    def _apply_changes(self, new_event: Event) -> bool:
+        """Fold a reloaded event into the cached state; False means a full reload is needed."""
+        assert self._repo is not None and self._tracker is not None
+        old_event = self._repo.event
+        if (
+            (old_event.id, old_event.name, old_event.start_date, old_event.end_date, old_event.metadata)
+            != (new_event.id, new_event.name, new_event.start_date, new_event.end_date, new_event.metadata)
+            or old_event.teams != new_event.teams
+            or old_event.venues != new_event.venues
+        ):
+            return False
+
+        old_matches: Dict[str, Match] = {match.id: match for match in old_event.matches}
+        schedule_changed = [match.id for match in old_event.matches] != [match.id for match in new_event.matches]
+        results_changed = False
+        for match in new_event.matches:
+            previous = old_matches.pop(match.id, None)
+            if previous is not None and previous == match:
+                continue
+            if previous is None or replace(previous, result=None, series_state=None) != replace(
+                match, result=None, series_state=None
+            ):
+                schedule_changed = True
+            if (previous.result if previous is not None else None) != match.result:
+                if previous is not None:
+                    self._tracker.remove(previous)
+                self._tracker.add(match)
+                results_changed = True
+            elif previous is not None and previous.series_state != match.series_state:
+                results_changed = True
+        for removed in old_matches.values():
+            self._tracker.remove(removed)
+            results_changed = True
+
+        old_event.matches = new_event.matches
+        if schedule_changed:
+            self._repo.mark_changed("matches")
+        if results_changed:
+            self._repo.mark_changed("results")
+        return True
+
+
+def watch_events(
+    paths: Sequence[Path | str],
+    emit: Callable[[WatchedEvent], None],
+    interval: float = 0.5,
+    stop: Callable[[], bool] | None = None,
+) -> None:
+    """
+    Poll event files and call ``emit`` for each one that changed.
+
+    Between polls the loop sleeps, so an idle watch costs one ``stat`` per file per
+    interval; the default half-second interval keeps update latency sub-second.
+    """
+    watched = [WatchedEvent(path) for path in paths]
+    while True:
+        for item in watched:
+            if item.refresh():
+                emit(item)
+        if stop is not None and stop():
+            return
+        time.sleep(interval)
+
+
+def _check_team_ids(event: Event) -> None:
+    """Reject matches naming teams the event does not define, before any cached state is touched."""
+    for match in event.matches:
+        for team_id in (match.team_one_id, match.team_two_id):
+            if team_id not in event.teams:
+                raise ValueError(f"Match {match.id} references unknown team: {team_id}")
+
+
+def _stat_signature(path: Path) -> _Signature | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
@@ -0,0 +1,30 @@
+import unittest
+from pathlib import Path
+
+from tournament_ops_intelligence.draw import DrawRequest, draw_groups, evaluate_draw
+from tournament_ops_intelligence.repository import TournamentRepository
+
+
+class DrawTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = TournamentRepository.from_json(Path("data/sample_event.json"))
+
+    def test_draw_beats_rating_ordered_split(self) -> None:
+        draw = draw_groups(self.repo.event, DrawRequest(group_count=2, workers=1))
+        self.assertEqual(sorted(len(group) for group in draw.groups), [2, 2])
+        self.assertEqual(sorted(t for group in draw.groups for t in group), sorted(self.repo.event.teams))
+        by_rating = sorted(self.repo.event.teams, key=lambda t: self.repo.event.teams[t].average_rating)
+        stacked = evaluate_draw(self.repo.event, [by_rating[:2], by_rating[2:]])
+        self.assertLess(draw.quality.rating_spread, stacked.rating_spread)
+
+    def test_pots_are_spread_across_groups(self) -> None:
+        pots = [["alpha", "charlie"], ["bravo", "delta"]]
+        ratings = {"alpha": 2000, "charlie": 1990, "bravo": 1500, "delta": 1400}
+        draw = draw_groups(self.repo.event, DrawRequest(group_count=2, pots=pots, ratings=ratings, workers=1))
+        for group in draw.groups:
+            self.assertEqual(sum(team in pots[0] for team in group), 1)
+        self.assertEqual(draw.quality.region_conflicts, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from tournament_ops_intelligence.analytics import strength_of_schedule
+from tournament_ops_intelligence.fairness import compare_schedules, schedule_fairness
+from tournament_ops_intelligence.repository import TournamentRepository
+from tournament_ops_intelligence.scheduler import ScheduleRequest, build_round_robin
+
+
+class FairnessTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = TournamentRepository.from_json(Path("data/sample_event.json"))
+        self.repo.event.venues["arena-north"].metadata["region"] = "NA"
+        self.start = datetime.fromisoformat("2024-07-01T09:00:00")
+
+    def _schedule(self, matches_per_day: int):
+        request = ScheduleRequest(stage="Groups", start_time=self.start, matches_per_day=matches_per_day, best_of=1)
+        return build_round_robin(self.repo.event, request)
+
+    def test_metrics_per_team(self) -> None:
+        matches = self._schedule(matches_per_day=6)
+        self.repo.upsert_matches(matches)
+        table = schedule_fairness(self.repo.event)
+        sos = strength_of_schedule(self.repo.event)
+        for team_id, row in table.items():
+            self.assertEqual(row.matches, 3)
+            self.assertAlmostEqual(row.strength_of_schedule, sos[team_id])
+            self.assertEqual(row.back_to_backs, 2)
+            self.assertEqual(row.rest_days, {0: 2})
+        self.assertEqual((table["alpha"].home_matches, table["alpha"].home_imbalance), (3, 3))
+        self.assertEqual(table["delta"].away_matches, 1)
+        self.assertEqual(table["alpha"].venue_switches, 0)
+        self.assertEqual(table["charlie"].venue_switches, 2)
+
+    def test_compare_schedules_side_by_side(self) -> None:
+        summaries = compare_schedules(
+            self.repo.event, {"packed": self._schedule(6), "one-a-day": self._schedule(1)}
+        )
+        self.assertGreater(summaries["packed"].total_back_to_backs, summaries["one-a-day"].total_back_to_backs)
+        self.assertEqual(summaries["one-a-day"].max_back_to_backs, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import random
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from tournament_ops_intelligence.projection import (
+    StandingsProjection,
+    lookup_series_probability,
+    series_win_probability,
+)
+from tournament_ops_intelligence.repository import TournamentRepository
+from tournament_ops_intelligence.scheduler import ScheduleRequest, build_round_robin
+from tournament_ops_intelligence.simulator import _play_series
+
+
+class ProjectionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = TournamentRepository.from_json(Path("data/sample_event.json"))
+        request = ScheduleRequest(stage="Groups", start_time=datetime.fromisoformat("2024-07-01T09:00:00"), best_of=3)
+        self.repo.upsert_matches(build_round_robin(self.repo.event, request))
+
+    def test_closed_form_matches_known_values_and_simulation(self) -> None:
+        self.assertAlmostEqual(series_win_probability(3, 0.6), 0.648)
+        self.assertAlmostEqual(series_win_probability(5, 0.5, 2, 1), 0.75)
+        self.assertEqual(series_win_probability(3, 0.3, 2, 0), 1.0)
+        self.assertAlmostEqual(lookup_series_probability(7, 0.55, 1, 2), series_win_probability(7, 0.55, 1, 2))
+        rng = random.Random(3)
+        trials = 20000
+        wins = sum(_play_series(5, 0.45, rng, 1, 2)[0] == 3 for _ in range(trials))
+        self.assertAlmostEqual(wins / trials, series_win_probability(5, 0.45, 1, 2), delta=0.02)
+
+    def test_live_updates_shift_expected_wins(self) -> None:
+        projection = StandingsProjection(self.repo.event)
+        self.assertAlmostEqual(sum(projection.expected_wins().values()), len(self.repo.event.matches))
+        match = self.repo.event.matches[0]
+        before = projection.expected_wins()
+        initial = projection.series_probability(match.id)
+        probability = projection.update(match.id, 1, 0)
+        after = projection.expected_wins()
+        self.assertGreater(probability, initial)
+        self.assertAlmostEqual(after[match.team_one_id] - before[match.team_one_id], probability - initial)
+        self.assertAlmostEqual(after[match.team_two_id] - before[match.team_two_id], initial - probability)
+        self.assertEqual(projection.update(match.id, 2, 0), 1.0)
+
+    def test_rejects_impossible_map_scores(self) -> None:
+        for one, two in ((-1, 0), (0, -1), (3, 0), (2, 2)):
+            with self.assertRaises(ValueError):
+                lookup_series_probability(3, 0.5, one, two)
+        match = self.repo.event.matches[0]
+        with self.assertRaises(ValueError):
+            self.repo.update_series(match.id, 3, 0)
+        self.assertIsNone(match.series_state)
+        self.assertEqual(self.repo.update_series(match.id, 2, 1).series_state.team_one_maps, 2)
+
+    def test_series_state_round_trips_through_json(self) -> None:
+        match = self.repo.update_series(self.repo.event.matches[0].id, 1, 0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "event.json"
+            self.repo.save_json(path)
+            loaded = TournamentRepository.from_json(path)
+        self.assertEqual(loaded.event.matches[0].series_state, match.series_state)
+        self.assertAlmostEqual(
+            StandingsProjection(loaded.event).series_probability(match.id),
+            StandingsProjection(self.repo.event).series_probability(match.id),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import csv
+import io
+import json
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from tournament_ops_intelligence import reports
+from tournament_ops_intelligence.models import MatchResult
+from tournament_ops_intelligence.reports import ReportRenderer, format_event_overview
+from tournament_ops_intelligence.repository import TournamentRepository
+from tournament_ops_intelligence.scheduler import ScheduleRequest, build_round_robin
+
+
+class ReportRendererTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = TournamentRepository.from_json(Path("data/sample_event.json"))
+        request = ScheduleRequest(stage="Groups", start_time=datetime.fromisoformat("2024-07-01T09:00:00"), best_of=1)
+        self.repo.upsert_matches(build_round_robin(self.repo.event, request))
+        self.now = datetime.fromisoformat("2024-06-30T00:00:00")
+
+    def test_rebuilds_only_sections_with_changed_inputs(self) -> None:
+        renderer = ReportRenderer(self.repo)
+        with mock.patch.object(reports, "compute_standings", wraps=reports.compute_standings) as standings, \
+                mock.patch.object(reports, "suggest_highlight_matches", wraps=reports.suggest_highlight_matches) as highlights:
+            first = renderer.render(now=self.now)
+            self.assertEqual(renderer.render(now=self.now), first)
+            self.assertEqual((standings.call_count, highlights.call_count), (1, 1))
+
+            match = self.repo.event.matches[0]
+            self.repo.record_results([MatchResult(match.id, match.team_one_id, 1, 0)])
+            updated = renderer.render(now=self.now)
+            self.assertEqual((standings.call_count, highlights.call_count), (2, 1))
+        self.assertNotEqual(updated, first)
+        self.assertIn("Team Alpha", updated)
+
+    def test_text_matches_overview_and_other_formats_parse(self) -> None:
+        renderer = ReportRenderer(self.repo)
+        self.assertEqual(renderer.render("text"), format_event_overview(self.repo.event))
+        payload = json.loads(renderer.render("json", now=self.now))
+        self.assertEqual(len(payload["teams"]), 4)
+        self.assertEqual(len(payload["schedule"]), 6)
+        rows = list(csv.reader(io.StringIO(renderer.render("csv", now=self.now))))
+        self.assertIn(["schedule"], rows)
+        self.assertIn("<h2>Standings</h2>", renderer.render("html", now=self.now))
+
+    def test_match_subset_limits_schedule_but_not_highlights(self) -> None:
+        subset = self.repo.event.matches[-1:]
+        self.assertIn("Team Alpha vs Collective Charlie", format_event_overview(self.repo.event, subset))
+        payload = json.loads(ReportRenderer(self.repo, matches=subset).render("json", now=self.now))
+        self.assertEqual([row["match_id"] for row in payload["schedule"]], [subset[0].id])
+        self.assertEqual(len(payload["highlights"]), 1)
+        self.assertNotEqual(payload["highlights"][0]["match_id"], subset[0].id)
+
+    def test_full_schedule_streams_one_chunk_per_match(self) -> None:
+        chunks = list(ReportRenderer(self.repo).iter_full_schedule("text"))
+        self.assertEqual(len(chunks), len(self.repo.event.matches))
+
+
+if __name__ == "__main__":
+    unittest.main()
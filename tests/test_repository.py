@@ -1,7 +1,14 @@
+import json
+import os
+import stat
+import tempfile
 import unittest
+from datetime import datetime
 from pathlib import Path
 
 from tournament_ops_intelligence.repository import TournamentRepository
+from tournament_ops_intelligence.scheduler import ScheduleRequest, build_round_robin
+from tournament_ops_intelligence.simulator import simulate_matches
 
 
 class RepositoryTests(unittest.TestCase):
@@ -11,6 +18,39 @@ class RepositoryTests(unittest.TestCase):
         self.assertEqual(len(repo.event.teams), 4)
         self.assertEqual(len(repo.event.venues), 2)
 
+    def test_save_preserves_existing_file_mode(self) -> None:
+        repo = TournamentRepository.from_json(Path("data/sample_event.json"))
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "event.json"
+            repo.save_json(path)
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o644)
+            os.chmod(path, 0o600)
+            repo.save_json(path)
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o600)
+
+    def test_rejects_unknown_venue_timezone(self) -> None:
+        payload = json.loads(Path("data/sample_event.json").read_text())
+        payload["venues"][0]["timezone"] = "Pacific Time"
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "event.json"
+            path.write_text(json.dumps(payload))
+            with self.assertRaisesRegex(ValueError, "arena-north"):
+                TournamentRepository.from_json(path)
+
+    def test_streamed_json_matches_dict_serialisation(self) -> None:
+        repo = TournamentRepository.from_json(Path("data/sample_event.json"))
+        request = ScheduleRequest(stage="Groups", start_time=datetime.fromisoformat("2024-07-01T09:00:00"))
+        repo.upsert_matches(build_round_robin(repo.event, request))
+        repo.upsert_matches(simulate_matches(repo.event, repo.event.matches[:3], seed=1))
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "event.json"
+            repo.save_json(path)
+            self.assertEqual(path.read_text(), json.dumps(repo.to_dict(), indent=2, sort_keys=True))
+            repo.save_json(path, compact=True)
+            self.assertEqual(json.loads(path.read_text()), repo.to_dict())
+            self.assertNotIn("\n", path.read_text())
+            self.assertEqual([p.name for p in Path(directory).iterdir()], ["event.json"])
+
 
 if __name__ == "__main__":
     unittest.main()
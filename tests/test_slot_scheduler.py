@@ -0,0 +1,92 @@
+import unittest
+from datetime import datetime, time, timedelta
+from pathlib import Path
+
+from tournament_ops_intelligence.repository import TournamentRepository
+from tournament_ops_intelligence.slot_scheduler import SlotScheduleRequest, StageSpec, build_slot_schedule
+
+
+class SlotSchedulerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = TournamentRepository.from_json(Path("data/sample_event.json"))
+        self.start = datetime.fromisoformat("2024-07-01T09:00:00")
+
+    def test_uses_venues_concurrently(self) -> None:
+        request = SlotScheduleRequest(stages=[StageSpec(stage="Groups", best_of=1)], start_time=self.start)
+        result = build_slot_schedule(self.repo.event, request)
+        self.assertEqual(len(result.matches), 6)
+        first_block = [m for m in result.matches if m.scheduled_time == self.start]
+        self.assertEqual({m.venue_id for m in first_block}, {"arena-north", "arena-south"})
+        self.assertEqual(result.metrics.utilisation, 1.0)
+
+    def test_double_round_robin_respects_rest(self) -> None:
+        request = SlotScheduleRequest(
+            stages=[StageSpec(stage="Groups", double_round_robin=True)],
+            start_time=self.start,
+            rest_minutes=90,
+        )
+        result = build_slot_schedule(self.repo.event, request)
+        self.assertEqual(len(result.matches), 12)
+        for team_id in self.repo.event.teams:
+            times = sorted(m.scheduled_time for m in result.matches if m.involves_team(team_id))
+            for earlier, later in zip(times, times[1:]):
+                self.assertGreaterEqual(later - earlier, timedelta(minutes=150))
+
+    def test_honours_venue_hours_and_team_availability(self) -> None:
+        request = SlotScheduleRequest(
+            stages=[StageSpec(stage="Groups")],
+            start_time=self.start,
+            venue_hours={"arena-south": (time(11, 0), time(13, 0))},
+            team_unavailability={"alpha": [(self.start, self.start + timedelta(days=1))]},
+        )
+        result = build_slot_schedule(self.repo.event, request)
+        for match in result.matches:
+            if match.venue_id == "arena-south":
+                self.assertIn(match.scheduled_time.hour, (11, 12))
+            if match.involves_team("alpha"):
+                self.assertGreaterEqual(match.scheduled_time, self.start + timedelta(days=1))
+
+    def test_blocks_stay_within_one_day(self) -> None:
+        overfull = SlotScheduleRequest(stages=[StageSpec(stage="Groups")], start_time=self.start, blocks_per_day=30)
+        with self.assertRaises(ValueError):
+            build_slot_schedule(self.repo.event, overfull)
+        request = SlotScheduleRequest(
+            stages=[StageSpec(stage="Groups", double_round_robin=True)],
+            start_time=self.start,
+            blocks_per_day=24,
+            venue_hours={venue_id: (time(0, 0), time(0, 0)) for venue_id in self.repo.event.venues},
+        )
+        result = build_slot_schedule(self.repo.event, request)
+        by_venue = {}
+        for match in result.matches:
+            by_venue.setdefault(match.venue_id, []).append(match.scheduled_time)
+        for times in by_venue.values():
+            times.sort()
+            for earlier, later in zip(times, times[1:]):
+                self.assertGreaterEqual(later - earlier, timedelta(minutes=60))
+
+    def test_naive_inputs_are_venue_wall_clock_time(self) -> None:
+        for venue in self.repo.event.venues.values():
+            venue.timezone = "America/New_York"
+            venue.metadata.update({"opens_at": "09:00", "closes_at": "22:00"})
+        request = SlotScheduleRequest(
+            stages=[StageSpec(stage="Groups")],
+            start_time=self.start,
+            team_unavailability={"alpha": [(self.start, self.start + timedelta(hours=1))]},
+        )
+        result = build_slot_schedule(self.repo.event, request)
+        self.assertEqual(min(m.scheduled_time for m in result.matches), self.start)
+        for match in result.matches:
+            self.assertGreaterEqual(match.scheduled_time.hour, 9)
+            if match.involves_team("alpha"):
+                self.assertGreaterEqual(match.scheduled_time, self.start + timedelta(hours=1))
+
+    def test_naive_start_rejected_across_timezones(self) -> None:
+        self.repo.event.venues["arena-north"].timezone = "Europe/Berlin"
+        request = SlotScheduleRequest(stages=[StageSpec(stage="Groups")], start_time=self.start)
+        with self.assertRaises(ValueError):
+            build_slot_schedule(self.repo.event, request)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+from tournament_ops_intelligence.models import Match, Venue
+from tournament_ops_intelligence.reports import ReportRenderer
+from tournament_ops_intelligence.repository import TournamentRepository
+from tournament_ops_intelligence.timeutils import TimeIndex, parse_datetime, to_epoch
+
+
+class TimeUtilsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.venues = {
+            "utc": Venue(id="utc", name="UTC Arena"),
+            "nyc": Venue(id="nyc", name="NYC Arena", timezone="America/New_York"),
+        }
+        self.matches = [
+            Match("late", "Groups", 1, "alpha", "bravo", datetime(2024, 7, 1, 12, 0), venue_id="nyc"),
+            Match("early", "Groups", 1, "charlie", "delta", datetime(2024, 7, 1, 14, 0), venue_id="utc"),
+        ]
+
+    def test_naive_times_use_venue_timezone(self) -> None:
+        self.assertEqual(to_epoch(datetime(2024, 7, 1, 12, 0), "America/New_York"), to_epoch(datetime(2024, 7, 1, 16, 0)))
+        aware = datetime(2024, 7, 1, 16, 0, tzinfo=timezone.utc)
+        self.assertEqual(to_epoch(aware, "America/New_York"), to_epoch(datetime(2024, 7, 1, 16, 0)))
+        self.assertIs(parse_datetime("2024-07-01T09:00:00"), parse_datetime("2024-07-01T09:00:00"))
+
+    def test_time_index_orders_by_utc_and_filters_windows(self) -> None:
+        index = TimeIndex(self.matches, self.venues)
+        self.assertEqual([m.id for m in index.matches], ["early", "late"])
+        cutoff = datetime(2024, 7, 1, 15, 0, tzinfo=timezone.utc)
+        self.assertEqual([m.id for m in index.upcoming(cutoff)], ["late"])
+        self.assertEqual([m.id for m in index.in_window(datetime(2024, 7, 1, 13, 0), cutoff)], ["early"])
+
+    def test_report_accepts_aware_now(self) -> None:
+        repo = TournamentRepository.from_json(Path("data/sample_event.json"))
+        repo.event.venues.update(self.venues)
+        repo.upsert_matches(self.matches)
+        report = ReportRenderer(repo).render(now=datetime(2024, 7, 1, 15, 0, tzinfo=timezone.utc))
+        self.assertIn("Team Alpha vs Squad Bravo", report)
+        self.assertNotIn("Collective Charlie vs Dynasty Delta (Stage", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+from tournament_ops_intelligence import reports
+from tournament_ops_intelligence.reports import ReportRenderer
+from tournament_ops_intelligence.repository import TournamentRepository
+from tournament_ops_intelligence.scheduler import ScheduleRequest, build_round_robin
+from tournament_ops_intelligence.simulator import simulate_matches
+from tournament_ops_intelligence.watch import WatchedEvent
+
+
+class WatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = TournamentRepository.from_json(Path("data/sample_event.json"))
+        request = ScheduleRequest(stage="Groups", start_time=datetime.fromisoformat("2024-07-01T09:00:00"))
+        self.repo.upsert_matches(build_round_robin(self.repo.event, request))
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "event.json"
+        self._write(self.repo.to_dict())
+        self.now = datetime.fromisoformat("2024-07-01T12:00:00")
+
+    def _write(self, payload: dict) -> None:
+        self.path.write_text(json.dumps(payload))
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    def test_reloads_only_on_change(self) -> None:
+        watched = WatchedEvent(self.path)
+        self.assertTrue(watched.refresh())
+        self.assertFalse(watched.refresh())
+
+    def test_skips_saves_with_unknown_team_ids(self) -> None:
+        watched = WatchedEvent(self.path)
+        watched.refresh()
+        good = "".join(watched.iter_render(now=self.now))
+        signature = watched._signature
+
+        payload = self.repo.to_dict()
+        payload["matches"][0]["team_two_id"] = "zzz"
+        self._write(payload)
+        self.assertFalse(watched.refresh())
+        self.assertEqual(watched._signature, signature)
+        self.assertEqual("".join(watched.iter_render(now=self.now)), good)
+
+        fresh = WatchedEvent(self.path)
+        self.assertFalse(fresh.refresh())
+        self.assertIsNone(fresh.repo)
+
+        self._write(self.repo.to_dict())
+        self.assertTrue(watched.refresh())
+
+    def test_applies_changed_results_incrementally(self) -> None:
+        watched = WatchedEvent(self.path)
+        watched.refresh()
+        "".join(watched.iter_render(now=self.now))
+
+        self.repo.upsert_matches(simulate_matches(self.repo.event, self.repo.event.matches[:2], seed=7))
+        with mock.patch.object(reports, "suggest_highlight_matches", wraps=reports.suggest_highlight_matches) as highlights:
+            self._write(self.repo.to_dict())
+            self.assertTrue(watched.refresh())
+            report = "".join(watched.iter_render(now=self.now))
+            self.assertEqual(highlights.call_count, 0)
+
+        fresh = ReportRenderer(TournamentRepository.from_json(self.path)).render(now=self.now)
+        self.assertEqual(report, fresh)
+        self.assertNotIn("No completed matches yet.", report)
+
+
+if __name__ == "__main__":
+    unittest.main()